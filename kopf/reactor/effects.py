@@ -19,9 +19,7 @@ It is used from in :mod:`processing`, :mod:`actitivies`, and :mod:`daemons` --
 all the modules, of which the reactor's core consists.
 """
 import asyncio
-import collections
 import contextlib
-import datetime
 import logging
 import time
 from typing import AsyncGenerator, Collection, Iterable, Optional, Tuple, Type, Union
@@ -30,16 +28,20 @@ from kopf.clients import patching
 from kopf.engines import loggers
 from kopf.structs import bodies, configuration, containers, dicts, \
                          diffs, patches, primitives, resources
+from kopf.utilities import backports
 
 # How often to wake up from the long sleep, to show liveness in the logs.
 WAITING_KEEPALIVE_INTERVAL = 10 * 60
 
+# Shorter delays are not distinguishable from no delays, so they are not slept at all.
+CLOCK_RESOLUTION = time.get_clock_info('monotonic').resolution
+
 # K8s-managed fields that are removed completely when patched to an empty list/dict.
-KNOWN_INCONSISTENCIES = (
+KNOWN_INCONSISTENCIES = frozenset({
     dicts.parse_field('metadata.annotations'),
     dicts.parse_field('metadata.finalizers'),
     dicts.parse_field('metadata.labels'),
-)
+})
 
 
 async def apply(
@@ -52,46 +54,58 @@ async def apply(
         logger: loggers.ObjectLogger,
         replenished: asyncio.Event,
 ) -> bool:
-    delay = min(delays) if delays else None
+
+    # The most frequent case for established objects: nothing to patch, nothing to wait for.
+    if not patch and not delays:
+        return True
+
+    loop = asyncio.get_running_loop()
+    storage = settings.persistence.progress_storage
+    delay: Optional[float]
+    if len(delays) == 1:  # no need to search for the minimum among one value.
+        delay, = delays
+    else:
+        delay = min(delays) if delays else None
 
     # Delete dummies on occasion, but don't trigger special patching for them [discussable].
     if patch:  # TODO: LATER: and the dummies are there (without additional methods?)
-        settings.persistence.progress_storage.touch(body=body, patch=patch, value=None)
+        storage.touch(body=body, patch=patch, value=None)
 
     # Actually patch if it was not empty originally or after the dummies removal.
     await patch_and_check(resource=resource, patch=patch, body=body, logger=logger)
 
     # Sleep strictly after patching, never before -- to keep the status proper.
     # The patching above, if done, interrupts the sleep instantly, so we skip it at all.
+    # For the same reason, no touch is needed: there is at most one PATCH per reaction cycle.
     # Note: a zero-second or negative sleep is still a sleep, it will trigger a dummy patch.
-    applied = False
-    if delay and patch:
-        logger.debug(f"Sleeping was skipped because of the patch, {delay} seconds left.")
+    if patch:
+        if delay:
+            logger.debug("Sleeping was skipped because of the patch, %s seconds left.", delay)
     elif delay is not None:
         if delay > WAITING_KEEPALIVE_INTERVAL:
             limit = WAITING_KEEPALIVE_INTERVAL
-            logger.debug(f"Sleeping for {delay} (capped {limit}) seconds for the delayed handlers.")
-            unslept_delay = await sleep_or_wait(limit, replenished)
-        elif delay > 0:
-            logger.debug(f"Sleeping for {delay} seconds for the delayed handlers.")
-            unslept_delay = await sleep_or_wait(delay, replenished)
+            logger.debug("Sleeping for %s (capped %s) seconds for the delayed handlers.",
+                         delay, limit)
+            unslept_delay = await sleep_or_wait(limit, replenished, loop=loop)
+        elif delay >= CLOCK_RESOLUTION:
+            logger.debug("Sleeping for %s seconds for the delayed handlers.", delay)
+            unslept_delay = await sleep_or_wait(delay, replenished, loop=loop)
         else:
             unslept_delay = None  # no need to sleep? means: slept in full.
 
-        # Exclude cases when touching immediately after patching (including: ``delay == 0``).
-        if patch and not delay:
-            pass
-        elif unslept_delay is not None:
-            logger.debug(f"Sleeping was interrupted by new changes, {unslept_delay} seconds left.")
+        # Touch only if slept in full: an interruption means a new cycle is coming anyway.
+        if unslept_delay is not None:
+            logger.debug("Sleeping was interrupted by new changes, %s seconds left.",
+                         unslept_delay)
         else:
             # Any unique always-changing value will work; not necessary a timestamp.
-            value = datetime.datetime.utcnow().isoformat()
+            value = f"{loop.time():.6f}"
             touch = patches.Patch()
-            settings.persistence.progress_storage.touch(body=body, patch=touch, value=value)
+            storage.touch(body=body, patch=touch, value=value)
             await patch_and_check(resource=resource, patch=touch, body=body, logger=logger)
-    elif not patch:  # no patch/touch and no delay
-        applied = True
-    return applied
+
+    # Either patched, or touched, or interrupted by new changes -- there will be a new cycle.
+    return False
 
 
 async def patch_and_check(
@@ -116,12 +130,14 @@ async def patch_and_check(
     a value and is persisted in the object and matches with the patch.
     """
     if patch:
-        logger.debug(f"Patching with: {patch!r}")
+        logger.debug("Patching with: %r", patch)  # formatted only if logged: patches can be big
         resulting_body = await patching.patch_obj(resource=resource, patch=patch, body=body)
-        inconsistencies = diffs.diff(dict(patch), dict(resulting_body), scope=diffs.DiffScope.LEFT)
+        # The response is a plain dict already; the patch is not, and the diff is type-strict.
+        # The diff is filtered while being generated, and is materialised only once, when filtered.
         inconsistencies = diffs.Diff(
             diffs.DiffItem(op, field, old, new)
-            for op, field, old, new in inconsistencies
+            for op, field, old, new in diffs.diff_iter(
+                dict(patch), resulting_body, scope=diffs.DiffScope.LEFT)
             if old or new or field not in KNOWN_INCONSISTENCIES
         )
         if inconsistencies:
@@ -129,8 +145,10 @@ async def patch_and_check(
 
 
 async def sleep_or_wait(
-        delays: Union[None, float, Collection[Union[None, float]]],
+        delay: Optional[float],
         wakeup: Optional[Union[asyncio.Event, primitives.DaemonStopper]] = None,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> Optional[float]:
     """
     Measure the sleep time: either until the timeout, or until the event is set.
@@ -139,30 +157,56 @@ async def sleep_or_wait(
     not interrupted and reached its specified delay (an equivalent of ``0``).
     In theory, the result can be ``0`` if the sleep was interrupted precisely
     the last moment before timing out; this is unlikely to happen though.
+
+    The delay is a single value; if there are several, the caller must choose
+    the shortest one (see also: `kopf.storage.states.State.delay`).
+    The callers that have the running loop already can pass it as ``loop``.
     """
-    passed_delays = delays if isinstance(delays, collections.abc.Collection) else [delays]
-    actual_delays = [delay for delay in passed_delays if delay is not None]
-    minimal_delay = min(actual_delays) if actual_delays else 0
 
     # Do not go for the real low-level system sleep if there is no need to sleep.
-    if minimal_delay <= 0:
+    # Sub-resolution sleeps are considered as done in full, same as zero or negative ones.
+    if delay is None or delay < CLOCK_RESOLUTION:
         return None
 
-    awakening_event = (
-        wakeup.async_event if isinstance(wakeup, primitives.DaemonStopper) else
-        wakeup if wakeup is not None else
-        asyncio.Event())
+    # Nothing can interrupt the sleep, so there is nothing to measure either.
+    awakening_event = _resolve_wakeup(wakeup)
+    if awakening_event is None:
+        await asyncio.sleep(delay)
+        return None
 
-    loop = asyncio.get_running_loop()
+    return await _sleep_scalar_event(delay, awakening_event, loop=loop)
+
+
+async def _sleep_scalar_event(
+        delay: float,
+        event: asyncio.Event,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Optional[float]:
+    """
+    The same as `sleep_or_wait`, but for one positive delay and a resolved event.
+    """
+    # Interrupted before it has even started: no need to arm the timer.
+    if event.is_set():
+        return delay
+
+    loop = loop if loop is not None else asyncio.get_running_loop()
+    start_time = loop.time()
     try:
-        start_time = loop.time()
-        await asyncio.wait_for(awakening_event.wait(), timeout=minimal_delay)
+        async with backports.timeout(delay):
+            await event.wait()
     except asyncio.TimeoutError:
         return None  # interruptable sleep is over: uninterrupted.
     else:
         end_time = loop.time()
         duration = end_time - start_time
-        return max(0, minimal_delay - duration)
+        return max(0, delay - duration)
+
+
+def _resolve_wakeup(
+        wakeup: Optional[Union[asyncio.Event, primitives.DaemonStopper]],
+) -> Optional[asyncio.Event]:
+    return wakeup.async_event if isinstance(wakeup, primitives.DaemonStopper) else wakeup
 
 
 @contextlib.asynccontextmanager
@@ -177,13 +221,18 @@ async def throttled(
     """
     A helper to throttle any arbitrary operation.
     """
+    loop = asyncio.get_running_loop()
+    awakening_event = _resolve_wakeup(wakeup)
 
     # The 1st sleep: if throttling is already active, but was interrupted by a queue replenishment.
     # It is needed to properly process the latest known event after the successful sleep.
+    # The deadline is re-checked after the sleep: other callers could re-activate the throttler
+    # while this one was sleeping -- then, the fresh deadline is theirs to track and to clear.
     if throttler.active_until is not None:
-        remaining_time = throttler.active_until - time.monotonic()
-        unslept_time = await sleep_or_wait(remaining_time, wakeup=wakeup)
-        if unslept_time is None:
+        active_until = throttler.active_until
+        remaining_time = active_until - loop.time()
+        unslept_time = await sleep_or_wait(remaining_time, wakeup=awakening_event, loop=loop)
+        if unslept_time is None and throttler.active_until == active_until:
             logger.info("Throttling is over. Switching back to normal operations.")
             throttler.active_until = None
 
@@ -210,7 +259,7 @@ async def throttled(
         throttle_delay = next(throttler.source_of_delays, throttler.last_used_delay)
         if throttle_delay is not None:
             throttler.last_used_delay = throttle_delay
-            throttler.active_until = time.monotonic() + throttle_delay
+            throttler.active_until = loop.time() + throttle_delay
             logger.exception(f"Throttling for {throttle_delay} seconds due to an unexpected error:")
 
     else:
@@ -221,8 +270,9 @@ async def throttled(
     # The 2nd sleep: if throttling has been just activated (i.e. there was a fresh error).
     # It is needed to have better logging/sleeping without workers exiting for "no events".
     if throttler.active_until is not None and should_run:
-        remaining_time = throttler.active_until - time.monotonic()
-        unslept_time = await sleep_or_wait(remaining_time, wakeup=wakeup)
-        if unslept_time is None:
+        active_until = throttler.active_until
+        remaining_time = active_until - loop.time()
+        unslept_time = await sleep_or_wait(remaining_time, wakeup=awakening_event, loop=loop)
+        if unslept_time is None and throttler.active_until == active_until:
             throttler.active_until = None
             logger.info("Throttling is over. Switching back to normal operations.")
@@ -19,3 +19,10 @@ else:
             name: Optional[str] = None,  # noqa
     ) -> asyncio_Task:
         return asyncio.create_task(coro)
+
+# Use the native timeouts where available, the aiohttp's dependency otherwise. Both avoid
+# the extra task per call, which `asyncio.wait_for` creates to run the awaited coroutine.
+if sys.version_info >= (3, 11):
+    timeout = asyncio.timeout
+else:
+    from async_timeout import timeout as timeout
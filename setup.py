@@ -47,6 +47,7 @@ setup(
         'click',
         'iso8601',
         'aiohttp<4.0.0',
+        'async_timeout; python_version<"3.11"',  # used only for timeouts in sleeps
         'aiojobs',
         'pykube-ng>=0.27',  # used only for config parsing
     ],
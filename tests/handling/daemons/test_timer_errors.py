@@ -90,7 +90,7 @@ async def test_timer_retried_on_temporary_error(
     await dummy.wait_for_daemon_done()
 
     assert k8s_mocked.sleep_or_wait.call_count == 2  # one for each retry
-    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == [1.0]  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == 1.0  # delays
     assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == 1.0  # interval
 
     assert_logs([
@@ -124,7 +124,7 @@ async def test_timer_retried_on_arbitrary_error_with_mode_temporary(
     await dummy.wait_for_daemon_done()
 
     assert k8s_mocked.sleep_or_wait.call_count == 2  # one for each retry
-    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == [1.0]  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == 1.0  # delays
     assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == 1.0  # interval
 
     assert_logs([
@@ -153,9 +153,9 @@ async def test_timer_retried_until_retries_limit(
     await dummy.wait_for_daemon_done()
 
     assert k8s_mocked.sleep_or_wait.call_count >= 4  # one for each retry
-    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == [1.0]  # delays
-    assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == [1.0]  # delays
-    assert k8s_mocked.sleep_or_wait.call_args_list[2][0][0] == [1.0]  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == 1.0  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == 1.0  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[2][0][0] == 1.0  # delays
     assert k8s_mocked.sleep_or_wait.call_args_list[3][0][0] == 1.0  # interval
 
 
@@ -179,7 +179,7 @@ async def test_timer_retried_until_timeout(
     await dummy.wait_for_daemon_done()
 
     assert k8s_mocked.sleep_or_wait.call_count >= 4  # one for each retry
-    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == [1.0]  # delays
-    assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == [1.0]  # delays
-    assert k8s_mocked.sleep_or_wait.call_args_list[2][0][0] == [1.0]  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[0][0][0] == 1.0  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[1][0][0] == 1.0  # delays
+    assert k8s_mocked.sleep_or_wait.call_args_list[2][0][0] == 1.0  # delays
     assert k8s_mocked.sleep_or_wait.call_args_list[3][0][0] == 1.0  # interval
@@ -49,7 +49,7 @@ async def test_delayed_handlers_progress(
     assert handlers.resume_mock.call_count == (1 if cause_reason == Reason.RESUME else 0)
 
     assert not k8s_mocked.sleep_or_wait.called
-    assert k8s_mocked.patch_obj.called
+    assert k8s_mocked.patch_obj.call_count == 1  # no extra touch-patch after the patch
 
     fname = f'{cause_reason}_fn'
     patch = k8s_mocked.patch_obj.call_args_list[0][1]['patch']
@@ -225,6 +225,23 @@ def test_set_awake_time(storage, handler, expected, body, delay):
     assert body == origbody  # not modified
 
 
+@freezegun.freeze_time(TS0)
+def test_shortest_delay_of_several_handlers(storage):
+    handler1 = Mock(id='id1', spec_set=['id'])
+    handler2 = Mock(id='id2', spec_set=['id'])
+    body = {'status': {'kopf': {'progress': {
+        'id1': {'started': TS0_ISO, 'delayed': TS1_ISO},
+        'id2': {'started': TS0_ISO, 'delayed': TSA_ISO},
+    }}}}
+    state = State.from_storage(body=Body(body), handlers=[handler1, handler2], storage=storage)
+    assert state.delay == pytest.approx((TSA - TS0).total_seconds())
+
+
+def test_no_delay_without_handlers(storage):
+    state = State.from_storage(body=Body({}), handlers=[], storage=storage)
+    assert state.delay is None
+
+
 @pytest.mark.parametrize('expected_retries, expected_delayed, delay, body', [
     (1, None, None, {}),
     (1, TS0_ISO, 0, {}),
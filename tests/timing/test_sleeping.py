@@ -12,39 +12,28 @@ async def test_the_only_delay_is_awaited(timer):
     assert unslept is None
 
 
-async def test_the_shortest_delay_is_awaited(timer):
-    with timer:
-        unslept = await asyncio.wait_for(sleep_or_wait([0.10, 0.20]), timeout=1.0)
-    assert 0.10 <= timer.seconds < 0.11
-    assert unslept is None
-
-
-async def test_specific_delays_only_are_awaited(timer):
+@pytest.mark.parametrize('delay', [
+    pytest.param(-10, id='negative'),
+    pytest.param(0, id='zero'),
+])
+async def test_nonpositive_delays_skip_sleeping(timer, delay):
     with timer:
-        unslept = await asyncio.wait_for(sleep_or_wait([0.10, None]), timeout=1.0)
-    assert 0.10 <= timer.seconds < 0.11
+        unslept = await asyncio.wait_for(sleep_or_wait(delay), timeout=1.0)
+    assert timer.seconds < 0.01
     assert unslept is None
 
 
-@pytest.mark.parametrize('delays', [
-    pytest.param([1000, -10], id='mixed-signs'),
-    pytest.param([-100, -10], id='all-negative'),
-    pytest.param(-10, id='alone'),
-])
-async def test_negative_delays_skip_sleeping(timer, delays):
+async def test_no_delay_skips_sleeping(timer):
     with timer:
-        unslept = await asyncio.wait_for(sleep_or_wait(delays), timeout=1.0)
+        unslept = await asyncio.wait_for(sleep_or_wait(None), timeout=1.0)
     assert timer.seconds < 0.01
     assert unslept is None
 
 
-@pytest.mark.parametrize('delays', [
-    pytest.param([], id='empty-list'),
-    pytest.param([None], id='list-of-none'),
-])
-async def test_no_delays_skip_sleeping(timer, delays):
+async def test_subresolution_delays_skip_sleeping(timer, mocker):
+    mocker.patch('kopf.reactor.effects.CLOCK_RESOLUTION', 0.10)
     with timer:
-        unslept = await asyncio.wait_for(sleep_or_wait(delays), timeout=1.0)
+        unslept = await asyncio.wait_for(sleep_or_wait(0.05), timeout=1.0)
     assert timer.seconds < 0.01
     assert unslept is None
 
@@ -75,3 +64,12 @@ async def test_with_zero_time_and_event_initially_set(timer):
         unslept = await asyncio.wait_for(sleep_or_wait(0, event), timeout=1.0)
     assert timer.seconds <= 0.01
     assert not unslept  # 0/None; undefined for such case: both goals reached.
+
+
+async def test_with_time_and_event_initially_set(timer):
+    event = asyncio.Event()
+    event.set()
+    with timer:
+        unslept = await asyncio.wait_for(sleep_or_wait(0.10, event), timeout=1.0)
+    assert timer.seconds <= 0.01
+    assert unslept == 0.10
@@ -9,8 +9,8 @@ from kopf.structs.containers import Throttler
 
 
 @pytest.fixture(autouse=True)
-def clock(mocker):
-    return mocker.patch('time.monotonic', return_value=0)
+async def clock(mocker):
+    return mocker.patch.object(asyncio.get_running_loop(), 'time', return_value=0)
 
 
 @pytest.fixture(autouse=True)
@@ -68,7 +68,7 @@ async def test_sleeps_for_the_first_delay_when_inactive(sleep):
     assert next(throttler.source_of_delays) == 234
 
     assert throttler.active_until is None  # means: no sleep time left
-    assert sleep.mock_calls == [call(123, wakeup=None)]
+    assert sleep.mock_calls == [call(123, wakeup=None, loop=asyncio.get_running_loop())]
 
 
 async def test_sleeps_for_the_next_delay_when_active(sleep):
@@ -87,7 +87,7 @@ async def test_sleeps_for_the_next_delay_when_active(sleep):
     assert next(throttler.source_of_delays, 999) == 999
 
     assert throttler.active_until is None  # means: no sleep time left
-    assert sleep.mock_calls == [call(234, wakeup=None)]
+    assert sleep.mock_calls == [call(234, wakeup=None, loop=asyncio.get_running_loop())]
 
 
 async def test_sleeps_for_the_last_known_delay_when_depleted(sleep):
@@ -109,7 +109,7 @@ async def test_sleeps_for_the_last_known_delay_when_depleted(sleep):
     assert next(throttler.source_of_delays, 999) == 999
 
     assert throttler.active_until is None  # means: no sleep time left
-    assert sleep.mock_calls == [call(234, wakeup=None)]
+    assert sleep.mock_calls == [call(234, wakeup=None, loop=asyncio.get_running_loop())]
 
 
 async def test_resets_on_success(sleep):
@@ -161,7 +161,7 @@ async def test_renews_on_repeated_failure(sleep):
     assert throttler.last_used_delay is 234
     assert throttler.source_of_delays is not None
     assert throttler.active_until is None
-    assert sleep.mock_calls == [call(234, wakeup=None)]
+    assert sleep.mock_calls == [call(234, wakeup=None, loop=asyncio.get_running_loop())]
 
 
 async def test_interruption(clock, sleep):
@@ -177,7 +177,7 @@ async def test_interruption(clock, sleep):
     assert throttler.last_used_delay == 123
     assert throttler.source_of_delays is not None
     assert throttler.active_until == 1123  # means: some sleep time is left
-    assert sleep.mock_calls == [call(123, wakeup=wakeup)]
+    assert sleep.mock_calls == [call(123, wakeup=wakeup, loop=asyncio.get_running_loop())]
 
 
 async def test_continuation_with_success(clock, sleep):
@@ -199,7 +199,7 @@ async def test_continuation_with_success(clock, sleep):
     assert throttler.last_used_delay is None
     assert throttler.source_of_delays is None
     assert throttler.active_until is None  # means: no sleep time is left
-    assert sleep.mock_calls == [call(123 - 77, wakeup=wakeup)]
+    assert sleep.mock_calls == [call(123 - 77, wakeup=wakeup, loop=asyncio.get_running_loop())]
 
 
 async def test_continuation_with_error(clock, sleep):
@@ -221,7 +221,10 @@ async def test_continuation_with_error(clock, sleep):
     assert throttler.last_used_delay == 234
     assert throttler.source_of_delays is not None
     assert throttler.active_until is None  # means: no sleep time is left
-    assert sleep.mock_calls == [call(123 - 77, wakeup=wakeup), call(234, wakeup=wakeup)]
+    assert sleep.mock_calls == [
+        call(123 - 77, wakeup=wakeup, loop=asyncio.get_running_loop()),
+        call(234, wakeup=wakeup, loop=asyncio.get_running_loop()),
+    ]
 
 
 async def test_continuation_when_overdue(clock, sleep):
@@ -243,7 +246,28 @@ async def test_continuation_when_overdue(clock, sleep):
     assert throttler.last_used_delay == 234
     assert throttler.source_of_delays is not None
     assert throttler.active_until is None  # means: no sleep time is left
-    assert sleep.mock_calls == [call(123 - 1000, wakeup=wakeup), call(234, wakeup=wakeup)]
+    assert sleep.mock_calls == [
+        call(123 - 1000, wakeup=wakeup, loop=asyncio.get_running_loop()),
+        call(234, wakeup=wakeup, loop=asyncio.get_running_loop()),
+    ]
+
+
+async def test_rearming_by_others_while_sleeping(clock, sleep):
+    wakeup = asyncio.Event()
+    logger = logging.getLogger()
+    throttler = Throttler()
+
+    async def rearm(*_, **__):
+        throttler.active_until = 9999  # simulated re-activation by a concurrent caller
+        return None
+
+    clock.return_value = 1000  # simulated "now"
+    sleep.side_effect = rearm
+    async with throttled(throttler=throttler, logger=logger, delays=[123], wakeup=wakeup):
+        raise Exception()
+
+    assert throttler.active_until == 9999  # means: not cleared, as it is not ours anymore
+    assert sleep.mock_calls == [call(123, wakeup=wakeup, loop=asyncio.get_running_loop())]
 
 
 async def test_recommends_running_initially():